@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json as _json
+import random
 from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import resolve_context
+from .utils_json import dumps as _json_dumps, loads as _json_loads
 
 
 class ApiError(RuntimeError):
@@ -16,6 +19,39 @@ class ApiError(RuntimeError):
         self.payload = payload
 
 
+class _JitterRetry(Retry):
+    """urllib3 Retry with full-jitter backoff: sleep uniformly in [0, exponential backoff]."""
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        # POSTs can create or mutate (incidents, synthetics trigger, monitor mute): only
+        # retry them when the server says the request was not processed.
+        if method and method.upper() == "POST":
+            return bool(self.total) and (
+                status_code == 429 or (status_code == 503 and has_retry_after)
+            )
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _default_retries() -> Retry:
+    # GETs retry on rate limits and transient server errors (including read timeouts);
+    # auth/validation errors (400/401/403) fail fast. POSTs are not in allowed_methods,
+    # so they never retry on timeouts or 5xx, only on 429 and 503 + Retry-After (see
+    # _JitterRetry.is_retry). Retry-After is honored.
+    # raise_on_status=False hands the last response back once retries are
+    # exhausted so it surfaces as ApiError like any other HTTP error.
+    return _JitterRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
 class ApiClient:
     def __init__(self, site: str, api_key: Optional[str], app_key: Optional[str]):
         self.site = site
@@ -23,6 +59,27 @@ class ApiClient:
         self.app_key = app_key
         self.base_url = f"https://api.{site}"
         self._timeout = 30
+        # One pooled session per client: keeps TCP+TLS connections alive across calls.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=_default_retries()),
+        )
+        # Headers never change for the client's lifetime: set them once on the session
+        # so requests don't need a per-call headers= dict.
+        # requests already offers gzip/deflate by default; set it explicitly so the
+        # (large, repetitive) JSON responses stay compressed on the wire regardless.
+        self._session.headers.update(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Content-Type": "application/json",
+            }
+        )
+        if api_key:
+            self._session.headers["DD-API-KEY"] = api_key
+        if app_key:
+            self._session.headers["DD-APPLICATION-KEY"] = app_key
 
     @staticmethod
     def create_from_context(
@@ -32,16 +89,8 @@ class ApiClient:
         site, api_key, app_key = resolve_context(context_name, config_path)
         return ApiClient(site=site, api_key=api_key, app_key=app_key)
 
-    def _headers(self) -> Dict[str, str]:
-        headers: Dict[str, str] = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        if self.api_key:
-            headers["DD-API-KEY"] = self.api_key
-        if self.app_key:
-            headers["DD-APPLICATION-KEY"] = self.app_key
-        return headers
+    def close(self) -> None:
+        self._session.close()
 
     def request(
         self,
@@ -51,30 +100,35 @@ class ApiClient:
         json: Optional[Dict[str, Any]] = None,
     ) -> Any:
         url = f"{self.base_url}{path}"
-        resp = requests.request(
+        # Serialize the body ourselves (orjson when available); Content-Type is set on the session
+        resp = self._session.request(
             method=method.upper(),
             url=url,
-            headers=self._headers(),
             params=params,
-            json=json,
+            data=_json_dumps(json) if json is not None else None,
             timeout=self._timeout,
         )
         if resp.status_code >= 400:
             payload = None
             try:
-                payload = resp.json()
+                payload = _json_loads(resp.content)
             except Exception:
                 payload = resp.text
             raise ApiError(resp.status_code, payload)
-        # Prefer JSON; some Datadog endpoints may not set content-type strictly.
-        try:
-            return resp.json()
-        except Exception:
+        content = resp.content
+        if not content:
             return resp.text
+        # Trust Content-Type; some Datadog endpoints don't set it strictly, so also sniff the body.
+        if "json" in resp.headers.get("Content-Type", "") or content.lstrip()[:1] in (b"{", b"["):
+            try:
+                return _json_loads(content)
+            except ValueError:
+                # e.g. a text/plain "[WARN] ..." body: fall back to text like any non-JSON reply
+                return resp.text
+        return resp.text
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         return self.request("GET", path, params=params)
 
     def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
         return self.request("POST", path, json=json)
-
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from .utils_json import loads as _json_loads
+
+CacheMode = Literal["enabled", "replay", "disabled"]
+CACHE_MODES = ("enabled", "replay", "disabled")
+DEFAULT_TTL = 60
+
+
+class CacheMiss(RuntimeError):
+    """No stored response for a query in 'replay' mode."""
+
+
+def _default_cache_dir() -> Path:
+    return Path(os.path.expanduser("~")) / ".cache" / "ddctl"
+
+
+def _cache_file(cache_dir: Path, client, path: str, key: Any) -> Path:
+    # Scope entries to the org/credentials, not just the site: two contexts on the same
+    # site must never see each other's responses. Keys only ever land in the hash.
+    scope = [client.site, client.api_key, client.app_key]
+    raw = json.dumps([scope, path, key], sort_keys=True, default=str)
+    return cache_dir / f"{hashlib.sha256(raw.encode('utf-8')).hexdigest()}.json"
+
+
+def _write_atomic(target: Path, data: Any) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def cached_post(
+    client,
+    path: str,
+    body: Any,
+    *,
+    key: Any = None,
+    ttl: int = DEFAULT_TTL,
+    mode: CacheMode = "enabled",
+    cache_dir: Optional[Path] = None,
+) -> Any:
+    """
+    client.post() through an on-disk response cache (~/.cache/ddctl/<sha256>.json).
+    - enabled: reuse entries younger than `ttl` seconds; otherwise call the API and store the result.
+    - replay: reuse stored entries regardless of age; a miss raises CacheMiss (no API calls).
+    - disabled: always call the API; the cache is neither read nor written.
+    `key` identifies the logical query and defaults to `body`; pass it when the body
+    embeds volatile values such as 'now' timestamps. Entries are scoped per site and
+    credentials (API/app key), so contexts never share responses.
+    """
+    if mode == "disabled":
+        return client.post(path, json=body)
+    target = _cache_file(cache_dir or _default_cache_dir(), client, path, body if key is None else key)
+    try:
+        age = time.time() - target.stat().st_mtime
+        if mode == "replay" or age <= ttl:
+            return _json_loads(target.read_bytes())
+    except (OSError, ValueError):
+        pass
+    if mode == "replay":
+        raise CacheMiss(f"No cached response for {path} (cache mode 'replay').")
+    data = client.post(path, json=body)
+    try:
+        _write_atomic(target, data)
+    except OSError:
+        # The cache is best-effort; an unwritable cache dir must not fail the command
+        pass
+    return data
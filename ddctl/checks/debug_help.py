@@ -1,82 +1,55 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator, List, Tuple
 
-from typer.testing import CliRunner
+import typer
 
+# Walks the Click command tree behind the Typer app directly (no --help rendering).
+# Groups are detected by duck typing so this works whether Typer ships Click or vendors it.
 
-def _invoke_help(app, path: List[str]) -> str:
-    runner = CliRunner()
-    result = runner.invoke(app, [*path, "--help"])
-    return result.output or ""
 
+def _subcommands(cmd) -> List[str]:
+    if not hasattr(cmd, "list_commands"):
+        return []
+    return list(cmd.list_commands(typer.Context(cmd)))
 
-def _parse_subcommands(help_text: str) -> List[str]:
-    lines = help_text.splitlines()
-    subcommands: List[str] = []
-    in_commands = False
-    for line in lines:
-        if not in_commands:
-            if line.strip().lower().startswith("commands:"):
-                in_commands = True
-            continue
-        # End of commands section when hitting another header or blank line without indentation
-        if not line.strip():
-            # blank line => likely end of section
-            if subcommands:
-                break
-            else:
-                continue
-        # Click formats subcommands like: "  name  Description..."
-        if line.startswith("  "):
-            # take the first token after leading spaces
-            name = line.strip().split()[0]
-            if name not in subcommands:
-                subcommands.append(name)
-            continue
-        # Non-indented line while parsing commands means next section
-        break
-    return subcommands
 
+def _has_debug(cmd) -> bool:
+    return any(
+        param.param_type_name == "option" and "--debug" in param.opts and not param.hidden
+        for param in cmd.params
+    )
 
-def _is_leaf(app, path: List[str]) -> bool:
-    help_text = _invoke_help(app, path)
-    subs = _parse_subcommands(help_text)
-    return len(subs) == 0
 
-
-def collect_inventory(app) -> List[str]:
+def _iter_leaves(app) -> Iterator[Tuple[str, object]]:
     """
-    Returns full command paths (space-separated) for all leaf commands.
-    Example: ["apm spans list", "apm errors rate", "metrics query", ...]
+    Yields (space-separated path, command) for every leaf command.
+    The Typer -> Click conversion runs once for the whole walk.
     """
-    inventory: List[str] = []
 
-    def _walk(path: List[str]) -> None:
-        help_text = _invoke_help(app, path)
-        subs = _parse_subcommands(help_text)
+    def _walk(cmd, path: Tuple[str, ...]) -> Iterator[Tuple[str, object]]:
+        subs = _subcommands(cmd)
         if not subs:
-            inventory.append(" ".join(path).strip())
+            if path:  # the root itself is never an inventory entry
+                yield " ".join(path), cmd
             return
+        ctx = typer.Context(cmd)
         for name in subs:
-            _walk([*path, name])
+            yield from _walk(cmd.get_command(ctx, name), path + (name,))
 
-    _walk([])
-    # Filter out the empty root entry if present
-    return [p for p in inventory if p]
+    yield from _walk(typer.main.get_command(app), ())
 
 
-def find_missing_debug(app) -> List[str]:
+def collect_inventory(app) -> List[str]:
     """
-    Returns leaf command paths whose --help output does NOT contain '--debug'.
+    Returns full command paths (space-separated) for all leaf commands.
+    Example: ["apm spans list", "apm errors rate", "metrics query", ...]
     """
-    missing: List[str] = []
-    runner = CliRunner()
-    for path in collect_inventory(app):
-        args = path.split() + ["--help"]
-        result = runner.invoke(app, args)
-        output = result.output or ""
-        if "--debug" not in output:
-            missing.append(path)
-    return missing
+    return [path for path, _ in _iter_leaves(app)]
+
 
+def find_missing_debug(app) -> List[str]:
+    """
+    Returns leaf command paths that do NOT declare a visible '--debug' option.
+    """
+    return [path for path, cmd in _iter_leaves(app) if not _has_debug(cmd)]
@@ -1,15 +1,78 @@
 from __future__ import annotations
 
+import atexit
+import importlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
+from typer.core import TyperGroup
 
 from .api import ApiClient
 from .i18n import t
 from .options import DebugOption
 
+# Sub-apps: module path + the short help listed by root --help. A module is imported
+# only when its subtree is dispatched; root --help is rendered from these stubs.
+_SUBCOMMANDS = {
+    "auth": (".commands.auth", t("Comandos de autenticación", "Authentication commands")),
+    "monitors": (".commands.monitors", t("Operaciones sobre Monitors", "Monitors operations")),
+    "dashboards": (".commands.dashboards", t("Operaciones sobre Dashboards", "Dashboards operations")),
+    "incidents": (".commands.incidents", t("Operaciones sobre Incidents", "Incidents operations")),
+    "synthetics": (".commands.synthetics", t("Operaciones sobre Synthetics", "Synthetics operations")),
+    "logs": (".commands.logs", t("Búsqueda de Logs", "Logs search")),
+    "apm": (".commands.apm", t("Operaciones de APM", "APM operations")),
+    "services": (".commands.services", "Service Catalog (Software Catalog v3)"),
+    "service": (".commands.service", t("Diagnóstico unificado por servicio", "Unified service troubleshooting")),
+    "metrics": (".commands.metrics", t("Operaciones de Métricas", "Metrics operations")),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_subcommand(name: str):
+    module = importlib.import_module(_SUBCOMMANDS[name][0], __package__)
+    group = typer.main.get_group(module.app)
+    group.name = name
+    return group
+
+
+@lru_cache(maxsize=None)
+def _help_stub(name: str) -> TyperGroup:
+    return TyperGroup(name=name, help=_SUBCOMMANDS[name][1])
+
+
+class _LazyGroup(TyperGroup):
+    _listing_help = False
+
+    def list_commands(self, ctx) -> List[str]:
+        return [*super().list_commands(ctx), *_SUBCOMMANDS]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in _SUBCOMMANDS:
+            return _help_stub(cmd_name) if self._listing_help else _load_subcommand(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(self, ctx, args):
+        # TyperGroup builds "Did you mean ...?" from self.commands: expose the lazy names as stubs
+        commands = self.commands
+        self.commands = {**commands, **{name: _help_stub(name) for name in _SUBCOMMANDS}}
+        try:
+            return super().resolve_command(ctx, args)
+        finally:
+            self.commands = commands
+
+    def format_help(self, ctx, formatter) -> None:
+        # Root help only shows names + short help: serve stubs instead of importing every sub-app
+        self._listing_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
+
 app = typer.Typer(
+    cls=_LazyGroup,
     add_completion=False,
     no_args_is_help=True,
     help=t("CLI de Datadog (ddogctl)", "Datadog CLI (ddogctl)"),
@@ -37,44 +100,25 @@ def main(
     ctx.obj["config_path"] = str(config) if config else None
 
 
+@lru_cache(maxsize=8)
+def _client_for(context_name: Optional[str], config_path: Optional[str]) -> ApiClient:
+    # One client (and pooled Session) per (context, config) for the whole process
+    client = ApiClient.create_from_context(context_name, config_path)
+    atexit.register(client.close)
+    return client
+
+
 def get_client_from_ctx(ctx: typer.Context) -> ApiClient:
     _ensure_ctx(ctx)
     context_name = ctx.obj.get("context_name")
     config_path = ctx.obj.get("config_path")
-    # No caching para simplicidad y evitar inconsistencias con cambios de opciones
-    client = ApiClient.create_from_context(context_name, config_path)
-    return client
-
+    return _client_for(context_name, config_path)
 
-# Registrar sub-apps
-from .commands import auth as auth_cmd  # noqa: E402
-from .commands import monitors as monitors_cmd  # noqa: E402
-from .commands import dashboards as dashboards_cmd  # noqa: E402
-from .commands import incidents as incidents_cmd  # noqa: E402
-from .commands import synthetics as synthetics_cmd  # noqa: E402
-from .commands import logs as logs_cmd  # noqa: E402
-from .commands import apm as apm_cmd  # noqa: E402
-from .commands import services as services_cmd  # noqa: E402
-from .commands import service as service_cmd  # noqa: E402
-from .commands import metrics as metrics_cmd  # noqa: E402
-from .i18n import t
-from rich.console import Console
-from importlib import resources as importlib_resources
-
-app.add_typer(auth_cmd.app, name="auth")
-app.add_typer(monitors_cmd.app, name="monitors")
-app.add_typer(dashboards_cmd.app, name="dashboards")
-app.add_typer(incidents_cmd.app, name="incidents")
-app.add_typer(synthetics_cmd.app, name="synthetics")
-app.add_typer(logs_cmd.app, name="logs")
-app.add_typer(apm_cmd.app, name="apm")
-app.add_typer(services_cmd.app, name="services")
-app.add_typer(service_cmd.app, name="service")
-app.add_typer(metrics_cmd.app, name="metrics")
-
-_console = Console()
 
+@lru_cache(maxsize=1)
 def _load_banner() -> str:
+    from importlib import resources as importlib_resources
+
     try:
         return importlib_resources.files("ddctl").joinpath("banner.txt").read_text(encoding="utf-8")
     except Exception:
@@ -83,5 +127,7 @@ def _load_banner() -> str:
 
 @app.command("guaf", help=t("Easter egg: imprime logo ASCII de Datadog", "Easter egg: print Datadog ASCII logo"))
 def guaf(debug: DebugOption = False) -> None:
-    _console.print(_load_banner(), style="bold magenta")
+    from rich.console import Console
+
+    Console().print(_load_banner(), style="bold magenta")
 
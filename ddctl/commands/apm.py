@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-from typing import Optional, List
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, List
 
 import typer
 from rich.console import Console
 from rich.table import Table
-from rich.json import JSON as RichJSON
 from datetime import datetime, timezone
-from dateutil import parser as dateutil_parser
 
 from ..cli import get_client_from_ctx
 from ..api import ApiError
 from ..utils_time import parse_time, to_iso8601
 from ..i18n import t
-from ..ui import new_table, build_title
+from ..ui import new_table, build_title, print_json
 
 app = typer.Typer(help=t("Operaciones de APM", "APM operations"))
 console = Console()
@@ -24,16 +25,21 @@ app.add_typer(spans_app, name="spans")
 app.add_typer(errors_app, name="errors")
 
 
-def _coerce_attrs_map(obj) -> dict:
+# Shared read-only empty map: missing/unknown attribute containers don't allocate
+_EMPTY_ATTRS: Mapping = MappingProxyType({})
+
+
+def _coerce_attrs_map(obj) -> Mapping:
     """
-    Normaliza estructuras de atributos/tags a un dict:
+    Normaliza estructuras de atributos/tags a un mapeo:
     - dict -> dict
     - lista de {key,value} -> {key: value}
     - lista de strings "k:v" -> {k: v}
+    - vacío/otro -> mapeo vacío compartido (solo lectura)
     """
     if isinstance(obj, dict):
         return obj
-    if isinstance(obj, list):
+    if isinstance(obj, list) and obj:
         result = {}
         for el in obj:
             if isinstance(el, dict):
@@ -46,10 +52,11 @@ def _coerce_attrs_map(obj) -> dict:
             elif isinstance(el, str) and ":" in el:
                 k, v = el.split(":", 1)
                 result[k.strip()] = v.strip()
-        return result
-    return {}
+        return result or _EMPTY_ATTRS
+    return _EMPTY_ATTRS
 
 
+@lru_cache(maxsize=256)
 def _build_query(service: Optional[str], extra: Optional[str], env: Optional[str] = None) -> str:
     terms: List[str] = []
     if service:
@@ -65,38 +72,111 @@ def _extract_buckets(resp: dict) -> List[dict]:
     if not isinstance(resp, dict):
         return []
     data = resp.get("data")
-    if isinstance(data, dict):
-        attrs = data.get("attributes") or {}
-        buckets = attrs.get("buckets") or []
-        return buckets if isinstance(buckets, list) else []
     if isinstance(data, list):
         # Some APIs may return buckets directly as list under data
         return data
-    # Fallback: try attributes at top-level
-    attrs = resp.get("attributes") or {}
-    buckets = attrs.get("buckets") or []
+    # Buckets live under data.attributes; fallback: attributes at top-level
+    container = data if isinstance(data, dict) else resp
+    buckets = (container.get("attributes") or {}).get("buckets")
     return buckets if isinstance(buckets, list) else []
 
 
+def _bucket_c0(ref: dict):
+    """First compute of a bucket: Datadog returns either 'compute': {'c0': N} or 'computes': [{'value': N}]."""
+    compute = ref.get("compute")
+    value = compute.get("c0") if isinstance(compute, dict) else None
+    if value is None:
+        computes = ref.get("computes")
+        value = computes[0].get("value") if computes and isinstance(computes[0], dict) else None
+    return value or 0
+
+
+_NS_PER_SEC = 1_000_000_000
+
+
 def _format_ts_parts(ts_raw) -> tuple[str, str]:
+    if isinstance(ts_raw, (int, float)) or (isinstance(ts_raw, str) and ts_raw):
+        return _format_ts_cached(ts_raw)
+    return "", ""
+
+
+@lru_cache(maxsize=1024)
+def _format_ts_cached(ts_raw) -> tuple[str, str]:
     if isinstance(ts_raw, (int, float)):
         try:
             # assume ns
-            dt = datetime.fromtimestamp(float(ts_raw) / 1_000_000_000.0, tz=timezone.utc)
+            dt = datetime.fromtimestamp(ts_raw / _NS_PER_SEC, tz=timezone.utc)
             return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
         except Exception:
             return "", str(ts_raw)
-    if isinstance(ts_raw, str) and ts_raw:
+    try:
+        # Datadog v2 timestamps are ISO-8601; dateutil only for anything fromisoformat rejects
         try:
+            dt = datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
+        except ValueError:
+            from dateutil import parser as dateutil_parser
+
             dt = dateutil_parser.parse(ts_raw)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            else:
-                dt = dt.astimezone(timezone.utc)
-            return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
-        except Exception:
-            return "", ts_raw
-    return "", ""
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        else:
+            dt = dt.astimezone(timezone.utc)
+        return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
+    except Exception:
+        return "", ts_raw
+
+
+# Span field lookup table: (column, candidate (source, key) pairs in priority order).
+# Source 0 is the merged nested tags map, source 1 the span's own attributes.
+_NESTED, _ATTRS = 0, 1
+_SPAN_FIELDS = (
+    ("env", ((_NESTED, "env"), (_ATTRS, "env"))),
+    ("service", ((_NESTED, "service"), (_ATTRS, "service"))),
+    # Resource can appear as resource, resource_name or resource.name
+    ("resource", (
+        (_NESTED, "resource_name"),
+        (_NESTED, "resource.name"),
+        (_ATTRS, "resource_name"),
+        (_ATTRS, "resource"),
+        (_NESTED, "resource"),
+    )),
+    # Fall back to operation name when there is no HTTP method
+    ("method", ((_NESTED, "http.method"), (_NESTED, "method"), (_ATTRS, "operation_name"))),
+    ("status", (
+        (_NESTED, "http.status_code"),
+        (_NESTED, "status_code"),
+        (_ATTRS, "status"),
+        (_NESTED, "status"),
+    )),
+    # Duration can be in ns (common). Fall back to ms if provided.
+    ("duration", ((_ATTRS, "duration"), (_NESTED, "duration"), (_NESTED, "duration.ms"))),
+    ("error", (
+        (_NESTED, "error.message"),
+        (_NESTED, "error.type"),
+        (_NESTED, "error"),
+        (_NESTED, "error.msg"),
+    )),
+)
+# Table column (header, style, no_wrap) for each _SPAN_FIELDS entry, same order
+_SPAN_COLUMNS = (
+    ("env", "blue", True),
+    ("service", "magenta", True),
+    ("resource", "white", False),
+    ("method", "green", True),
+    ("status", "green", True),
+    ("duration_s", "yellow", True),
+    ("error_message", "red", False),
+)
+# Bit i of the column mask tracks column i + 1 of a processed row (column 0 is the timestamp)
+_BIT_ENV, _BIT_SERVICE = 1 << 0, 1 << 1
+
+
+def _first_value(sources: tuple, candidates: tuple):
+    for src, key in candidates:
+        val = sources[src].get(key)
+        if val:
+            return val
+    return ""
 
 
 def _render_spans_table(items: List[dict]) -> None:
@@ -104,14 +184,17 @@ def _render_spans_table(items: List[dict]) -> None:
     env_set = set()
     service_set = set()
     date_set = set()
+    present_mask = 0
 
     for item in items:
         attrs = (item or {}).get("attributes") or {}
-        # Span tags can live under attributes.attributes or attributes.tags; sometimes lists
-        nested = {}
-        nested.update(_coerce_attrs_map(attrs.get("attributes")))
-        nested.update(_coerce_attrs_map(attrs.get("custom")))
-        nested.update(_coerce_attrs_map(attrs.get("tags")))
+        # Span tags can live under attributes.attributes or attributes.tags; sometimes lists.
+        # Precedence tags > custom > attributes, resolved by lookup order (no merged copy).
+        nested = ChainMap(
+            _coerce_attrs_map(attrs.get("tags")),
+            _coerce_attrs_map(attrs.get("custom")),
+            _coerce_attrs_map(attrs.get("attributes")),
+        )
         # Timestamp: some payloads provide 'timestamp' (ISO) and others 'start' in ns
         ts_raw = (
             attrs.get("timestamp")
@@ -122,36 +205,9 @@ def _render_spans_table(items: List[dict]) -> None:
         date_str, time_str = _format_ts_parts(ts_raw)
         if date_str:
             date_set.add(date_str)
-        env = nested.get("env") or attrs.get("env") or ""
-        service = nested.get("service") or attrs.get("service") or ""
-        # Resource can appear as resource, resource_name or resource.name
-        resource = (
-            nested.get("resource_name")
-            or nested.get("resource.name")
-            or attrs.get("resource_name")
-            or attrs.get("resource")
-            or nested.get("resource")
-            or ""
-        )
-        method = (
-            nested.get("http.method")
-            or nested.get("method")
-            or attrs.get("operation_name")  # fallback to operation name
-            or ""
-        )
-        status = (
-            nested.get("http.status_code")
-            or nested.get("status_code")
-            or attrs.get("status")
-            or nested.get("status")
-            or ""
-        )
-        # Duration can be in ns (common). Fall back to ms if provided.
-        duration = (
-            attrs.get("duration")
-            or nested.get("duration")
-            or nested.get("duration.ms")
-            or 0
+        sources = (nested, attrs)
+        env, service, resource, method, status, duration, error_msg = (
+            _first_value(sources, candidates) for _, candidates in _SPAN_FIELDS
         )
         try:
             # Many span durations are ns; convert to ms if duration seems large
@@ -159,14 +215,11 @@ def _render_spans_table(items: List[dict]) -> None:
             duration_s = d / 1_000_000_000.0 if d > 10_000_000 else d / 1000.0
         except Exception:
             duration_s = 0.0
-        error_msg = (
-            nested.get("error.message")
-            or nested.get("error.type")
-            or nested.get("error")
-            or nested.get("error.msg")
-            or ""
-        )
-        processed_rows.append((time_str, env, service, resource, method, status, f"{duration_s:.3f}", str(error_msg)[:120]))
+        row = (time_str, env, service, resource, method, status, f"{duration_s:.3f}", str(error_msg)[:120])
+        for i, val in enumerate(row[1:]):
+            if val:
+                present_mask |= 1 << i
+        processed_rows.append(row)
         if env:
             env_set.add(env)
         if service:
@@ -181,50 +234,21 @@ def _render_spans_table(items: List[dict]) -> None:
     if len(service_set) == 1:
         metadata["service"] = next(iter(service_set))
 
+    # Hide columns that are blank across all rows; env/service move to the title when constant
+    col_mask = present_mask
+    if len(env_set) == 1:
+        col_mask &= ~_BIT_ENV
+    if len(service_set) == 1:
+        col_mask &= ~_BIT_SERVICE
+    cols = [i for i in range(len(_SPAN_COLUMNS)) if col_mask & (1 << i)]
+
     table = new_table("Spans", metadata)
     table.add_column("timestamp", style="cyan", no_wrap=True)
-    # Determine column presence (hide columns that are blank across all rows)
-    any_env = any(r[1] for r in processed_rows)
-    any_service = any(r[2] for r in processed_rows)
-    any_resource = any(r[3] for r in processed_rows)
-    any_method = any(r[4] for r in processed_rows)
-    any_status = any(r[5] for r in processed_rows)
-    any_duration = any(r[6] for r in processed_rows)
-    any_error = any(r[7] for r in processed_rows)
-
-    # Only include env/service columns if they are not constant and not blank
-    if len(env_set) != 1 and any_env:
-        table.add_column("env", style="blue", no_wrap=True)
-    if len(service_set) != 1 and any_service:
-        table.add_column("service", style="magenta", no_wrap=True)
-    if any_resource:
-        table.add_column("resource", style="white")
-    if any_method:
-        table.add_column("method", style="green", no_wrap=True)
-    if any_status:
-        table.add_column("status", style="green", no_wrap=True)
-    if any_duration:
-        table.add_column("duration_s", style="yellow", no_wrap=True)
-    if any_error:
-        table.add_column("error_message", style="red")
-
-    for ts, env, service, resource, method, status, duration_ms, error_msg in processed_rows:
-        row = [ts]
-        if len(env_set) != 1 and any_env:
-            row.append(env)
-        if len(service_set) != 1 and any_service:
-            row.append(service)
-        if any_resource:
-            row.append(resource)
-        if any_method:
-            row.append(method)
-        if any_status:
-            row.append(status)
-        if any_duration:
-            row.append(duration_ms)
-        if any_error:
-            row.append(error_msg)
-        table.add_row(*row)
+    for i in cols:
+        name, style, no_wrap = _SPAN_COLUMNS[i]
+        table.add_column(name, style=style, no_wrap=no_wrap)
+    for row in processed_rows:
+        table.add_row(row[0], *[row[i + 1] for i in cols])
 
     console.print(table)
 
@@ -265,7 +289,7 @@ def spans_list(
         items = data.get("data") or []
         if debug and items:
             console.rule("raw item (GET /spans/events)")
-            console.print(RichJSON.from_data(items[0]))
+            print_json(console, items[0], compact=True)
         _render_spans_table(items)
     except Exception as exc:
         if debug:
@@ -318,7 +342,7 @@ def spans_search(
         items = data.get("data") or []
         if debug and items:
             console.rule("raw item (POST /spans/events/search)")
-            console.print(RichJSON.from_data(items[0]))
+            print_json(console, items[0], compact=True)
         _render_spans_table(items)
     except Exception as exc:
         if debug:
@@ -329,6 +353,7 @@ def spans_search(
         raise typer.Exit(code=1) from exc
 
 
+@lru_cache(maxsize=256)
 def _error_query(service: Optional[str], extra: Optional[str], env: Optional[str] = None) -> str:
     base = _build_query(service, extra, env)
     # Generic error filter; adjust to your instrumentation
@@ -382,12 +407,12 @@ def errors_top_resources(
         }
         if debug:
             console.rule("aggregate payload")
-            console.print(RichJSON.from_data(body))
+            print_json(console, body, compact=True)
         with console.status("[dim]Calculando agregados de errores[/dim]"):
             data = client.post("/api/v2/spans/analytics/aggregate", json=body) or {}
         if debug:
             console.rule("aggregate response")
-            console.print(RichJSON.from_data(data))
+            print_json(console, data, compact=True)
         buckets = _extract_buckets(data)
         table = new_table("Top resources by error count", {"service": service, "env": env or "", "from": from_})
         table.add_column("resource_name", style="magenta")
@@ -395,13 +420,7 @@ def errors_top_resources(
         for b in buckets:
             ref = b.get("attributes") or b
             res = (ref.get("by") or {}).get("resource_name", "")
-            # Datadog returns either 'compute': {'c0': N} or 'computes': [{'value': N}]
-            compute_obj = ref.get("compute") or {}
-            if isinstance(compute_obj, dict) and "c0" in compute_obj:
-                count = compute_obj.get("c0", 0)
-            else:
-                computes = ref.get("computes") or [{}]
-                count = (computes[0] or {}).get("value", 0)
+            count = _bucket_c0(ref)
             table.add_row(str(res), str(count))
         console.print(table)
     except Exception as exc:
@@ -454,12 +473,12 @@ def errors_rate(
         }
         if debug:
             console.rule("aggregate payload")
-            console.print(RichJSON.from_data(body))
+            print_json(console, body, compact=True)
         with console.status("[dim]Calculando agregados de errores[/dim]"):
             data = client.post("/api/v2/spans/analytics/aggregate", json=body) or {}
         if debug:
             console.rule("aggregate response")
-            console.print(RichJSON.from_data(data))
+            print_json(console, data, compact=True)
         buckets = _extract_buckets(data)
         table = new_table(f"Error count by {group_by}", {"service": service, "env": env or "", "from": from_})
         table.add_column(group_by, style="magenta")
@@ -467,12 +486,7 @@ def errors_rate(
         for b in buckets:
             ref = b.get("attributes") or b
             key = (ref.get("by") or {}).get(group_by, "")
-            compute_obj = ref.get("compute") or {}
-            if isinstance(compute_obj, dict) and "c0" in compute_obj:
-                count = compute_obj.get("c0", 0)
-            else:
-                computes = ref.get("computes") or [{}]
-                count = (computes[0] or {}).get("value", 0)
+            count = _bucket_c0(ref)
             table.add_row(str(key), str(count))
         console.print(table)
     except Exception as exc:
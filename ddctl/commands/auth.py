@@ -3,10 +3,10 @@ from __future__ import annotations
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.json import JSON as RichJSON
 
 from ..cli import get_client_from_ctx
 from ..i18n import t
+from ..ui import print_json
 from ..options import DebugOption
 
 app = typer.Typer(help=t("Comandos de autenticación", "Authentication commands"))
@@ -28,7 +28,7 @@ def status(ctx: typer.Context, debug: DebugOption = False) -> None:
         valid = bool(data.get("valid")) if isinstance(data, dict) else False
         if debug:
             console.rule("validate response")
-            console.print(RichJSON.from_data(data))
+            print_json(console, data, compact=True)
         console.print(
             Panel.fit(
                 f"[bold]site[/bold]: {client.site}\n[bold]api_key_valid[/bold]: {valid}",
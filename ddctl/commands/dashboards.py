@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import typer
 from rich.console import Console
-from rich.json import JSON
 
 from ..cli import get_client_from_ctx
 from ..i18n import t
+from ..ui import print_json
 from ..api import ApiError
 
 app = typer.Typer(help=t("Operaciones sobre Dashboards", "Dashboards operations"))
@@ -29,7 +29,7 @@ def get_dashboard(
     try:
         with console.status("[dim]Cargando dashboard[/dim]"):
             data = client.get(f"/api/v1/dashboard/{id}")
-        console.print(JSON.from_data(data))
+        print_json(console, data)
     except Exception as exc:
         if debug and isinstance(exc, ApiError):
             console.print(f"[red]HTTP {exc.status_code}[/red] {exc.payload}")
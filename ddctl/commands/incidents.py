@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import typer
 from rich.console import Console
-from rich.json import JSON
 
 from ..cli import get_client_from_ctx
 from ..i18n import t
+from ..ui import print_json
 from ..options import DebugOption
 
 app = typer.Typer(help=t("Operaciones sobre Incidents", "Incidents operations"))
@@ -39,7 +39,7 @@ def create_incident(
         }
         with console.status("[dim]Creando incidente[/dim]"):
             data = client.post("/api/v2/incidents", json=payload)
-        console.print(JSON.from_data(data))
+        print_json(console, data)
     except Exception as exc:
         raise typer.Exit(code=1) from exc
 
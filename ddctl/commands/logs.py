@@ -10,8 +10,7 @@ from ..cli import get_client_from_ctx
 from ..utils_time import parse_time, to_iso8601
 from ..i18n import t
 from ..options import DebugOption
-from rich.json import JSON as RichJSON
-from ..ui import new_table
+from ..ui import new_table, print_json
 
 app = typer.Typer(help=t("Búsqueda de Logs", "Logs search"))
 console = Console()
@@ -68,7 +67,7 @@ def query_logs(
             data = client.post("/api/v2/logs/events/search", json=payload) or {}
         if debug:
             console.rule("logs search response")
-            console.print(RichJSON.from_data(data))
+            print_json(console, data, compact=True)
             return
         items = data.get("data") or []
         table = new_table("Logs", {"service": service or "", "from": from_, "to": to})
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import typer
@@ -10,7 +11,7 @@ from ..cli import get_client_from_ctx
 from ..utils_time import parse_time
 from ..i18n import t
 from ..api import ApiError
-from ..ui import new_table
+from ..ui import new_table, print_json
 
 app = typer.Typer(help=t("Operaciones de Métricas", "Metrics operations"))
 console = Console()
@@ -23,31 +24,29 @@ def _fmt_decimal(val: float, decimals: int = 4) -> str:
     except Exception:
         return str(val)
 
+
+_BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+
+
 def _fmt_bytes(val: float) -> str:
     try:
-        units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB"]
         x = float(val)
         i = 0
-        while x >= 1024.0 and i < len(units) - 1:
+        while x >= 1024.0 and i < len(_BYTE_UNITS) - 1:
             x /= 1024.0
             i += 1
-        return f"{_fmt_decimal(x, 2)} {units[i]}"
+        return f"{_fmt_decimal(x, 2)} {_BYTE_UNITS[i]}"
     except Exception:
         return str(val)
 
-def _query_last_point(client, q: str, start_s: int, end_s: int, rollup: Optional[int], debug: bool) -> Optional[float]:
+def _query_series(client, q: str, start_s: int, end_s: int, rollup: Optional[int]) -> dict:
     params = {"from": start_s, "to": end_s, "query": q}
     if rollup:
         params["rollup"] = rollup
-    with console.status(f"[dim]Consultando métricas[/dim] {q}"):
-        resp = client.get("/api/v1/query", params=params) or {}
-    if debug:
-        try:
-            from rich.json import JSON as RichJSON
-            console.rule(q)
-            console.print(RichJSON.from_data(resp))
-        except Exception:
-            pass
+    return client.get("/api/v1/query", params=params) or {}
+
+
+def _last_point(resp: dict) -> Optional[float]:
     series = resp.get("series") or []
     if not series:
         return None
@@ -93,18 +92,18 @@ def metrics_query(
         with console.status("[dim]Consultando series temporales[/dim]"):
             resp = client.get("/api/v1/query", params=params) or {}
         if debug:
-            from rich.json import JSON as RichJSON
-            console.print(RichJSON.from_data(resp))
+            print_json(console, resp, compact=True)
             return
         series = resp.get("series") or []
+        scope_prefix = f"{scope_tag}:" if scope_tag else ""
 
         def _extract_scope(s: dict) -> str:
             scope = s.get("scope") or ""
-            if not scope_tag:
+            if not scope_prefix:
                 return scope
             for part in scope.split(","):
                 part = part.strip()
-                if part.startswith(f"{scope_tag}:"):
+                if part.startswith(scope_prefix):
                     return part
             return scope
 
@@ -233,9 +232,19 @@ def k8s_resources(
         q_mem_lim = f"sum:kubernetes.memory.limits{{{tag_filter}}}"
         q_mem_use = f"sum:container.memory.usage{{{tag_filter}}}"
 
-        cpu_req = _query_last_point(client, q_cpu_req, start, end, rollup, debug)
-        cpu_lim = _query_last_point(client, q_cpu_lim, start, end, rollup, debug)
-        cpu_use = _query_last_point(client, q_cpu_use, start, end, rollup, debug)
+        # Independent queries: fan out over the client's pooled session
+        queries = (q_cpu_req, q_cpu_lim, q_cpu_use, q_mem_req, q_mem_lim, q_mem_use)
+        with console.status("[dim]Consultando métricas[/dim]"):
+            with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+                responses = list(pool.map(lambda q: _query_series(client, q, start, end, rollup), queries))
+        if debug:
+            try:
+                for q, resp in zip(queries, responses):
+                    console.rule(q)
+                    print_json(console, resp, compact=True)
+            except Exception:
+                pass
+        cpu_req, cpu_lim, cpu_use, mem_req, mem_lim, mem_use = (_last_point(r) for r in responses)
         # kubernetes.cpu.usage.total.as_rate() devuelve nanocores/seg -> convertir a cores
         if cpu_use is not None:
             try:
@@ -243,10 +252,6 @@ def k8s_resources(
             except Exception:
                 pass
 
-        mem_req = _query_last_point(client, q_mem_req, start, end, rollup, debug)
-        mem_lim = _query_last_point(client, q_mem_lim, start, end, rollup, debug)
-        mem_use = _query_last_point(client, q_mem_use, start, end, rollup, debug)
-
         table = new_table("K8s resources", {"cluster": cluster, "service": kube_service or kube_deployment or "", "from": from_, "to": to})
         table.add_column("resource", style="magenta")
         table.add_column("requests", style="cyan", no_wrap=True)
@@ -292,8 +297,7 @@ def metrics_tag_cardinality(
     try:
         resp = client.get(f"/api/v2/metrics/{metric}/tag-cardinality-details") or {}
         if debug:
-            from rich.json import JSON as RichJSON
-            console.print(RichJSON.from_data(resp))
+            print_json(console, resp, compact=True)
             return
         # Response shape can vary; attempt to read keys commonly returned
         data = resp.get("data") or resp
@@ -5,8 +5,7 @@ from typing import Optional
 import typer
 from rich.console import Console
 from rich.table import Table
-from ..ui import new_table
-from rich.json import JSON
+from ..ui import new_table, print_json
 
 from ..cli import get_client_from_ctx
 from ..i18n import t
@@ -36,9 +35,10 @@ def list_monitors(
         with console.status("[dim]Cargando monitores[/dim]"):
             items = client.get("/api/v1/monitor") or []
         if name:
-            items = [m for m in items if name.lower() in (m.get("name", "") or "").lower()]
+            needle = name.lower()
+            items = [m for m in items if needle in (m.get("name", "") or "").lower()]
         if debug:
-            console.print(JSON.from_data(items))
+            print_json(console, items, compact=True)
             return
         table = new_table("Monitors")
         table.add_column("id", style="cyan", no_wrap=True)
@@ -73,7 +73,7 @@ def mute_monitor(
     try:
         with console.status("[dim]Silenciando monitor[/dim]"):
             data = client.post(f"/api/v1/monitor/{id}/mute", json={})
-        console.print(JSON.from_data(data))
+        print_json(console, data)
     except Exception as exc:
         raise typer.Exit(code=1) from exc
 
@@ -1,107 +1,153 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, Iterator, Optional, Tuple, List
 
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.json import JSON as RichJSON
 
 from ..cli import get_client_from_ctx
 from ..api import ApiError, ApiClient
+from ..cache import CACHE_MODES, CacheMiss, cached_post
 from ..utils_time import parse_time, to_iso8601
 from ..i18n import t
 from ..options import DebugOption
-from ..ui import new_table, build_title
+from ..ui import print_json, new_table, build_title
 
 # Reuse helpers from APM module
 from .apm import _build_query as _apm_build_query
 from .apm import _error_query as _apm_error_query
 from .apm import _extract_buckets as _apm_extract_buckets
+from .apm import _bucket_c0 as _apm_bucket_c0
 
 app = typer.Typer(help=t("Diagnóstico unificado por servicio", "Unified service troubleshooting"))
 console = Console()
 
+_AGGREGATE_PATH = "/api/v2/spans/analytics/aggregate"
+_LOGS_SEARCH_PATH = "/api/v2/logs/events/search"
 
+# Column specs for the troubleshoot tables: (header, style, no_wrap, max_width); capped columns truncate overlong tokens with an ellipsis
+_OVERVIEW_COLS = (("metric", "cyan", True, None), ("value", "magenta", True, None))
+_TOP_ERR_COLS = (("resource_name", "magenta", False, None), ("count", "cyan", True, None))
+_LOGS_COLS = (
+    ("timestamp", "cyan", True, None),
+    ("service", "magenta", True, None),
+    ("status", "green", True, None),
+    ("message", "white", False, 80),
+)
+_NO_ITEM = object()
+
+
+@lru_cache(maxsize=256)
 def _cluster_extra(cluster: Optional[str]) -> Optional[str]:
     if not cluster:
         return None
     return f"cluster:{cluster}"
 
 
+# Known aggregate response shapes: first bucket (data.attributes.buckets, a bare data
+# list, or top-level attributes.buckets) and un-bucketed totals
+_FIRST_BUCKET_PATHS = (("data", "attributes", "buckets", 0), ("data", 0), ("attributes", "buckets", 0))
+_TOTALS_PATHS = (("data", "attributes"), ("attributes",))
+
+
+def _dig(obj, path: tuple):
+    try:
+        for key in path:
+            obj = obj[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return obj
+
+
+def _first_dict(obj, paths: tuple) -> Optional[dict]:
+    for path in paths:
+        found = _dig(obj, path)
+        if isinstance(found, dict):
+            return found
+    return None
+
+
+def _first_bucket_attrs(resp: dict) -> Optional[dict]:
+    bucket = _first_dict(resp, _FIRST_BUCKET_PATHS)
+    if bucket is None:
+        return None
+    return bucket.get("attributes") or bucket
+
+
+_COMPUTE_KEYS = frozenset(("c0", "c1", "c2"))
+
+
 def _safe_get_compute_values(resp: dict) -> dict:
     """
     Tries to extract compute results from aggregate responses.
     Supports both 'compute': {'c0': X, 'c1': Y} and 'computes': [{'value': X}, {'value': Y}] shapes,
-    optionally wrapped in a single bucket.
-    Returns a map like {'c0': <num>, 'c1': <num>} when possible.
+    in the first bucket or, failing that, directly under attributes (totals).
+    Returns a map like {'c0': <num>, 'c1': <num>} from the first container that has one.
     """
     if not isinstance(resp, dict):
         return {}
-    # First, try buckets (common response shape even without group_by)
-    buckets = _apm_extract_buckets(resp)
-    if isinstance(buckets, list) and buckets:
-        # Take the first bucket for totals
-        ref = (buckets[0] or {}).get("attributes") or buckets[0] or {}
-        compute = ref.get("compute") or {}
-        if isinstance(compute, dict) and ("c0" in compute or "c1" in compute or "c2" in compute):
+    for container in (_first_bucket_attrs(resp), _first_dict(resp, _TOTALS_PATHS)):
+        if not isinstance(container, dict):
+            continue
+        compute = container.get("compute")
+        if isinstance(compute, dict) and not _COMPUTE_KEYS.isdisjoint(compute):
             return compute
-        computes = ref.get("computes")
-        if isinstance(computes, list) and computes:
-            out = {}
-            for idx, entry in enumerate(computes):
-                if isinstance(entry, dict) and "value" in entry:
-                    out[f"c{idx}"] = entry.get("value")
-            if out:
-                return out
-    # Fallback: some APIs may place totals directly under attributes
-    attrs = (resp.get("data") or {}).get("attributes") if isinstance(resp.get("data"), dict) else resp.get("attributes") or {}
-    if isinstance(attrs, dict):
-        compute = attrs.get("compute") or {}
-        if isinstance(compute, dict) and compute:
-            return compute
-        computes = attrs.get("computes")
-        if isinstance(computes, list) and computes:
-            out = {}
-            for idx, entry in enumerate(computes):
-                if isinstance(entry, dict) and "value" in entry:
-                    out[f"c{idx}"] = entry.get("value")
+        computes = container.get("computes")
+        if isinstance(computes, list):
+            out = {
+                f"c{idx}": entry["value"]
+                for idx, entry in enumerate(computes)
+                if isinstance(entry, dict) and "value" in entry
+            }
             if out:
                 return out
     return {}
 
 
+@lru_cache(maxsize=256)
 def _convert_duration_to_ms(value: float) -> float:
     """
     Heuristic conversion:
     - If it looks like nanoseconds (very large), convert ns -> ms
     - Else if it looks like microseconds, convert us -> ms
     - Else assume already ms or seconds-ish; if < 10, assume seconds and convert to ms.
+    Takes an already-coerced float (the cache keys on it).
     """
-    try:
-        v = float(value)
-    except Exception:
-        return 0.0
-    if v > 10_000_000:  # likely nanoseconds
-        return v / 1_000_000.0
-    if v > 10_000:  # likely microseconds
-        return v / 1000.0
+    if value > 10_000_000:  # likely nanoseconds
+        return value / 1_000_000.0
+    if value > 10_000:  # likely microseconds
+        return value / 1000.0
     # If small number, assume seconds -> ms
-    if v <= 10:
-        return v * 1000.0
-    return v  # assume already ms
+    if value <= 10:
+        return value * 1000.0
+    return value  # assume already ms
+
+
+def _mk_table(title: str, metadata: dict, cols: tuple) -> Table:
+    table = new_table(title, metadata)
+    for name, style, no_wrap, max_width in cols:
+        table.add_column(
+            name,
+            style=style,
+            no_wrap=no_wrap,
+            max_width=max_width,
+            overflow="ellipsis",
+        )
+    return table
 
 
-def _render_overview_table(total_count: int, error_count: int, p95_ms: float, from_label: str, service: str, env: Optional[str], cluster: Optional[str]) -> None:
-    table = new_table(
+def _render_overview_table(total_count: int, error_count: int, err_rate: float, p95_ms: float, from_label: str, service: str, env: Optional[str], cluster: Optional[str]) -> None:
+    table = _mk_table(
         "APM overview",
         {"service": service, "env": env or "", "cluster": cluster or "", "from": from_label},
+        _OVERVIEW_COLS,
     )
-    table.add_column("metric", style="cyan", no_wrap=True)
-    table.add_column("value", style="magenta", no_wrap=True)
 
-    err_rate = (error_count / max(1, total_count)) if total_count else 0.0
     table.add_row("total_spans", str(total_count))
     table.add_row("error_spans", str(error_count))
     table.add_row("error_rate", f"{err_rate*100:.2f}%")
@@ -109,25 +155,60 @@ def _render_overview_table(total_count: int, error_count: int, p95_ms: float, fr
     console.print(table)
 
 
-def _render_top_errors_table(buckets: List[dict], service: str, env: Optional[str], from_label: str, cluster: Optional[str]) -> None:
-    table = new_table("Top error resources (resource_name)", {"service": service, "env": env or "", "cluster": cluster or "", "from": from_label})
-    table.add_column("resource_name", style="magenta")
-    table.add_column("count", style="cyan", no_wrap=True)
+def _render_top_errors_table(
+    buckets: List[dict], service: str, env: Optional[str], from_label: str, cluster: Optional[str]
+) -> List[Tuple[str, int]]:
+    """Render the top error resources and return their (resource, count) pairs for the summary."""
+    table = _mk_table(
+        "Top error resources (resource_name)",
+        {"service": service, "env": env or "", "cluster": cluster or "", "from": from_label},
+        _TOP_ERR_COLS,
+    )
+    pairs: List[Tuple[str, int]] = []
     for b in buckets:
         ref = b.get("attributes") or b
         res = (ref.get("by") or {}).get("resource_name", "")
-        compute_obj = ref.get("compute") or {}
-        if isinstance(compute_obj, dict) and "c0" in compute_obj:
-            count = compute_obj.get("c0", 0)
-        else:
-            computes = ref.get("computes") or [{}]
-            count = (computes[0] or {}).get("value", 0)
+        count = _apm_bucket_c0(ref)
         table.add_row(str(res), str(count))
+        if res:
+            pairs.append((str(res), int(count)))
     console.print(table)
+    return pairs
+
+
+def _extract_log_row(item: dict) -> Tuple[str, str, str, str]:
+    attrs = (item or {}).get("attributes") or {}
+    nested_attrs = attrs.get("attributes") or {}
+    message_val = nested_attrs.get("message") or attrs.get("message") or ""
+    if isinstance(message_val, (dict, list)):
+        message_val = str(message_val)
+    return (
+        str(attrs.get("timestamp", "") or ""),
+        str(nested_attrs.get("service") or attrs.get("service") or ""),
+        str(attrs.get("status") or ""),
+        (str(message_val) or "")[:400],
+    )
+
+
+def _iter_log_rows(resp: Optional[dict]) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield only the rendered fields of each log event, one event at a time."""
+    data = (resp or {}).get("data")
+    if isinstance(data, list):
+        for item in data:
+            yield _extract_log_row(item)
 
 
-def _render_logs_table(items: List[dict], service: str, env: Optional[str], from_label: str, cluster: Optional[str]) -> None:
-    if not items:
+def _render_logs_table(
+    log_rows: Iterable[Tuple[str, str, str, str]],
+    service: str,
+    env: Optional[str],
+    from_label: str,
+    cluster: Optional[str],
+) -> None:
+    # Consumes any iterable one row at a time; peek once to detect the empty case
+    rows = iter(log_rows)
+    first = next(rows, _NO_ITEM)
+    if first is _NO_ITEM:
         console.print(
             Panel.fit(
                 t("No hay datos de logs en el rango seleccionado.", "No logs data in the selected range."),
@@ -136,22 +217,13 @@ def _render_logs_table(items: List[dict], service: str, env: Optional[str], from
             )
         )
         return
-    table = new_table("Last error logs", {"service": service, "env": env or "", "cluster": cluster or "", "from": from_label})
-    table.add_column("timestamp", style="cyan", no_wrap=True)
-    table.add_column("service", style="magenta", no_wrap=True)
-    table.add_column("status", style="green", no_wrap=True)
-    table.add_column("message", style="white")
-    for item in items:
-        attrs = (item or {}).get("attributes") or {}
-        timestamp = attrs.get("timestamp", "") or ""
-        nested_attrs = attrs.get("attributes") or {}
-        service_val = nested_attrs.get("service") or attrs.get("service") or ""
-        status_val = attrs.get("status") or ""
-        message_val = nested_attrs.get("message") or attrs.get("message") or ""
-        if isinstance(message_val, (dict, list)):
-            message_val = str(message_val)
-        msg = (str(message_val) or "")[:400]
-        table.add_row(str(timestamp), str(service_val), str(status_val), msg)
+    table = _mk_table(
+        "Last error logs",
+        {"service": service, "env": env or "", "cluster": cluster or "", "from": from_label},
+        _LOGS_COLS,
+    )
+    for row in chain((first,), rows):
+        table.add_row(*row)
     console.print(table)
 
 
@@ -178,8 +250,23 @@ def service_troubleshoot(
     env: Optional[str] = typer.Option(None, "--env", help=t("Entorno (p. ej., prd/dev)", "Environment (e.g., prd/dev)")),
     from_: str = typer.Option("now-1h", "--from", help=t("Inicio del rango", "Range start"), show_default=True),
     cluster: Optional[str] = typer.Option(None, "--cluster", help=t("Filtrar por cluster:<name>", "Filter by cluster:<name>")),
+    no_cache: bool = typer.Option(False, "--no-cache", help=t("No usar la caché local de respuestas", "Do not use the local response cache")),
+    cache_mode: str = typer.Option(
+        "enabled",
+        "--cache-mode",
+        help=t(
+            "Caché de respuestas (enabled|replay|disabled); replay no llama a la API",
+            "Response cache (enabled|replay|disabled); replay makes no API calls",
+        ),
+        show_default=True,
+    ),
     debug: DebugOption = False,
 ) -> None:
+    if cache_mode not in CACHE_MODES:
+        raise typer.BadParameter("--cache-mode must be one of: enabled, replay, disabled")
+    # --debug keeps payload/response logs live, so it bypasses cached results
+    if no_cache or (debug and cache_mode == "enabled"):
+        cache_mode = "disabled"
     client = get_client_from_ctx(ctx)
 
     try:
@@ -188,17 +275,16 @@ def service_troubleshoot(
         payload_from = to_iso8601(dt_from)
         payload_to = to_iso8601(parse_time("now"))
         extra = _cluster_extra(cluster)
+        q_all = _apm_build_query(service, extra, env)
+        q_err = _apm_error_query(service, extra, env)
+        filt_base = {"from": payload_from, "to": payload_to}
 
         # APM overview: totals + p95
         body_overview = {
             "data": {
                 "type": "aggregate_request",
                 "attributes": {
-                    "filter": {
-                        "from": payload_from,
-                        "to": payload_to,
-                        "query": _apm_build_query(service, extra, env),
-                    },
+                    "filter": {**filt_base, "query": q_all},
                     "compute": [
                         {"aggregation": "count"},  # c0
                         {"aggregation": "pc95", "metric": "duration"},  # c1
@@ -206,56 +292,26 @@ def service_troubleshoot(
                 },
             }
         }
-        if debug:
-            console.rule("APM overview payload")
-            console.print(RichJSON.from_data(body_overview))
-        with console.status("[dim]APM overview[/dim]"):
-            resp_overview = client.post("/api/v2/spans/analytics/aggregate", json=body_overview) or {}
-        if debug:
-            console.rule("APM overview response")
-            console.print(RichJSON.from_data(resp_overview))
-        computes_ov = _safe_get_compute_values(resp_overview)
-        total_count = int(computes_ov.get("c0") or 0)
-        p95_raw = float(computes_ov.get("c1") or 0.0)
-        p95_ms = _convert_duration_to_ms(p95_raw)
 
         # APM errors: count
         body_errors = {
             "data": {
                 "type": "aggregate_request",
                 "attributes": {
-                    "filter": {
-                        "from": payload_from,
-                        "to": payload_to,
-                        "query": _apm_error_query(service, extra, env),
-                    },
+                    "filter": {**filt_base, "query": q_err},
                     "compute": [
                         {"aggregation": "count"},  # c0
                     ],
                 },
             }
         }
-        if debug:
-            console.rule("APM errors payload")
-            console.print(RichJSON.from_data(body_errors))
-        with console.status("[dim]APM errores[/dim]"):
-            resp_errors = client.post("/api/v2/spans/analytics/aggregate", json=body_errors) or {}
-        if debug:
-            console.rule("APM errors response")
-            console.print(RichJSON.from_data(resp_errors))
-        computes_err = _safe_get_compute_values(resp_errors)
-        error_count = int(computes_err.get("c0") or 0)
 
         # APM top error resources
         body_top = {
             "data": {
                 "type": "aggregate_request",
                 "attributes": {
-                    "filter": {
-                        "from": payload_from,
-                        "to": payload_to,
-                        "query": _apm_error_query(service, extra, env),
-                    },
+                    "filter": {**filt_base, "query": q_err},
                     "compute": [{"aggregation": "count"}],
                     "group_by": [
                         {
@@ -267,69 +323,96 @@ def service_troubleshoot(
                 },
             }
         }
-        if debug:
-            console.rule("APM top-resources payload")
-            console.print(RichJSON.from_data(body_top))
-        with console.status("[dim]APM top recursos[/dim]"):
-            resp_top = client.post("/api/v2/spans/analytics/aggregate", json=body_top) or {}
-        if debug:
-            console.rule("APM top-resources response")
-            console.print(RichJSON.from_data(resp_top))
-        buckets_top = _apm_extract_buckets(resp_top)
 
         # Logs: last 10 error logs
-        q_parts = [f"service:{service}", "status:error"]
-        if env:
-            q_parts.append(f"env:{env}")
-        if cluster:
-            q_parts.append(f"cluster:{cluster}")
+        q_logs = (
+            f"service:{service} status:error"
+            + (f" env:{env}" if env else "")
+            + (f" cluster:{cluster}" if cluster else "")
+        )
         logs_payload = {
-            "filter": {
-                "from": payload_from,
-                "to": payload_to,
-                "query": " ".join(q_parts),
-            },
+            "filter": {**filt_base, "query": q_logs},
             "page": {"limit": 10},
             "sort": "-timestamp",
         }
+
         if debug:
-            console.rule("Logs search payload")
-            console.print(RichJSON.from_data(logs_payload))
-        with console.status("[dim]Consultando logs[/dim]"):
-            logs_resp = client.post("/api/v2/logs/events/search", json=logs_payload) or {}
+            for label, body in (
+                ("APM overview payload", body_overview),
+                ("APM errors payload", body_errors),
+                ("APM top-resources payload", body_top),
+                ("Logs search payload", logs_payload),
+            ):
+                console.rule(label)
+                print_json(console, body, compact=True)
+
+        # Bodies embed 'now', so cache entries are keyed on the command's inputs instead
+        cache_key = [service, env, cluster, from_]
+
+        # Overview, errors and logs are independent: run them concurrently over the pooled
+        # session. Top resources only matter when there are errors, so that query waits for
+        # the error count (overlapping with whatever is still in flight).
+        with console.status("[dim]Consultando APM y logs[/dim]"):
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                fut_overview = pool.submit(
+                    cached_post, client, _AGGREGATE_PATH, body_overview, key=["overview", *cache_key], mode=cache_mode
+                )
+                fut_errors = pool.submit(
+                    cached_post, client, _AGGREGATE_PATH, body_errors, key=["errors", *cache_key], mode=cache_mode
+                )
+                fut_logs = pool.submit(
+                    cached_post, client, _LOGS_SEARCH_PATH, logs_payload, key=["logs", *cache_key], mode=cache_mode
+                )
+                resp_errors = fut_errors.result() or {}
+                computes_err = _safe_get_compute_values(resp_errors)
+                error_count = int(computes_err.get("c0") or 0)
+                resp_top = None
+                if error_count > 0:
+                    resp_top = cached_post(
+                        client, _AGGREGATE_PATH, body_top, key=["top", *cache_key], mode=cache_mode
+                    ) or {}
+                resp_overview = fut_overview.result() or {}
+                logs_resp = fut_logs.result() or {}
+
         if debug:
-            console.rule("Logs search response")
-            console.print(RichJSON.from_data(logs_resp))
-        log_items = (logs_resp or {}).get("data") or []
+            for label, resp in (
+                ("APM overview response", resp_overview),
+                ("APM errors response", resp_errors),
+                ("APM top-resources response", resp_top),
+                ("Logs search response", logs_resp),
+            ):
+                if resp is None:
+                    continue
+                console.rule(label)
+                print_json(console, resp, compact=True)
+
+        computes_ov = _safe_get_compute_values(resp_overview)
+        total_count = int(computes_ov.get("c0") or 0)
+        p95_raw = float(computes_ov.get("c1") or 0.0)
+        p95_ms = _convert_duration_to_ms(p95_raw)
+
+        buckets_top = _apm_extract_buckets(resp_top)
+
+        err_rate = error_count / total_count if total_count else 0.0
 
         # Render
-        _render_overview_table(total_count, error_count, p95_ms, from_, service, env, cluster)
-        _render_top_errors_table(buckets_top or [], service, env, from_, cluster)
-        _render_logs_table(log_items, service, env, from_, cluster)
+        _render_overview_table(total_count, error_count, err_rate, p95_ms, from_, service, env, cluster)
+        top_pairs = _render_top_errors_table(buckets_top or [], service, env, from_, cluster)
+        _render_logs_table(_iter_log_rows(logs_resp), service, env, from_, cluster)
 
         # Heuristic summary
-        err_rate = (error_count / max(1, total_count)) if total_count else 0.0
-        top_pairs: List[Tuple[str, int]] = []
-        for b in buckets_top or []:
-            ref = b.get("attributes") or b
-            res = (ref.get("by") or {}).get("resource_name", "")
-            compute_obj = ref.get("compute") or {}
-            if isinstance(compute_obj, dict) and "c0" in compute_obj:
-                cnt = int(compute_obj.get("c0") or 0)
-            else:
-                computes = ref.get("computes") or [{}]
-                cnt = int((computes[0] or {}).get("value") or 0)
-            if res:
-                top_pairs.append((str(res), cnt))
         summary_text = _heuristic_summary(err_rate, p95_ms, top_pairs)
         console.print(Panel.fit(summary_text, title="Resumen", border_style="blue"))
 
     except Exception as exc:
-        if debug:
+        if isinstance(exc, CacheMiss):
+            # Replay misses are a usage problem, not an API failure: always say what is missing
+            console.print(f"[red]Error:[/red] {exc}")
+        elif debug:
             if isinstance(exc, ApiError):
                 console.print(f"[red]HTTP {exc.status_code}[/red]")
                 try:
-                    console.print(RichJSON.from_data(exc.payload))
+                    print_json(console, exc.payload, compact=True)
                 except Exception:
                     console.print(str(exc.payload))
             else:
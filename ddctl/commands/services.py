@@ -1,17 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
 import typer
-import yaml
 from rich.console import Console
-from rich.json import JSON as RichJSON
-from rich.table import Table
-from ..ui import new_table
+from ..ui import print_json, new_table, status
 
 from ..cli import get_client_from_ctx
-from ..i18n import t
+from ..i18n import get_lang, t
 from ..api import ApiError
 
 app = typer.Typer(help=t("Service Catalog (Software Catalog v3)", "Service Catalog (Software Catalog v3)"))
@@ -27,10 +25,36 @@ ERROR_MSG = {
     "en": '✖ Failed to update service "{service}".',
 }
 
+_LANG = get_lang()
+_SUCCESS_TPL = SUCCESS_MSG[_LANG]
+_ERROR_TPL = ERROR_MSG[_LANG]
+
+_ENTITY_PATH = "/api/v2/catalog/entity"
+_APPLY_WORKERS = 8
+
 # -------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------
 
+def _load_entity_files(files: List[Path]) -> List[dict]:
+    """Lee un entity YAML (v3) por archivo."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    entities: List[dict] = []
+    for f in files:
+        try:
+            data = yaml.load(Path(f).read_bytes(), Loader=loader)
+        except yaml.YAMLError as exc:
+            raise typer.BadParameter(f"{f}: invalid YAML: {exc}") from exc
+        if not isinstance(data, dict):
+            raise typer.BadParameter(f"{f}: expected a YAML mapping (Software Catalog v3 entity)")
+        if not isinstance(data.get("metadata"), dict):
+            raise typer.BadParameter(f"{f}: 'metadata' must be a mapping")
+        entities.append(data)
+    return entities
+
+
 def _build_entity_payload(
     service: str,
     description: Optional[str],
@@ -39,21 +63,18 @@ def _build_entity_payload(
     tier: Optional[str],
     tags: List[str],
 ) -> dict:
+    tier_value = None
     if tier:
-        try:
-            tier_value = str(int(tier))
-        except ValueError:
+        digits = tier.strip()
+        if not digits.isdecimal():
             raise typer.BadParameter("--tier must be an integer (1-4)")
-    else:
-        tier_value = None
+        tier_value = str(int(digits))
 
-    all_tags: List[str] = []
-    if env:
-        all_tags.append(f"env:{env}")
-    if team:
-        all_tags.append(f"team:{team}")
-    if tags:
-        all_tags.extend(tags)
+    all_tags = [
+        *((f"env:{env}",) if env else ()),
+        *((f"team:{team}",) if team else ()),
+        *(tags or ()),
+    ]
 
     payload = {
         "apiVersion": "v3",
@@ -74,23 +95,27 @@ def _build_entity_payload(
     return payload
 
 
+def _row_of(item: dict) -> tuple[str, str, str, str]:
+    attrs = item.get("attributes") or {}
+    spec = (item.get("included_schema") or {}).get("spec") or {}
+    tags = attrs.get("tags") or ()
+    return (
+        attrs.get("name", ""),
+        attrs.get("owner", ""),
+        str(spec.get("tier", "")),
+        ", ".join(map(str, tags)) if isinstance(tags, (list, tuple)) else str(tags),
+    )
+
+
 def _render_entities_table(items: list[dict]) -> None:
     table = new_table("Service Catalog")
     table.add_column("service", style="magenta", no_wrap=True)
     table.add_column("owner", style="cyan")
     table.add_column("tier", style="yellow")
-    table.add_column("tags", style="white")
+    table.add_column("tags", style="white", max_width=80, overflow="ellipsis")
 
     for item in items:
-        attrs = item.get("attributes", {})
-        schema = item.get("included_schema", {})
-
-        name = attrs.get("name", "")
-        owner = attrs.get("owner", "")
-        tags = ", ".join(attrs.get("tags", []))
-        tier = schema.get("spec", {}).get("tier", "")
-
-        table.add_row(name, owner, str(tier), tags)
+        table.add_row(*_row_of(item))
 
     console.print(table)
 
@@ -105,7 +130,10 @@ def _render_entities_table(items: list[dict]) -> None:
 )
 def apply_service(
     ctx: typer.Context,
-    service: str = typer.Option(..., "--service", help="Service name"),
+    service: Optional[str] = typer.Option(None, "--service", help="Service name"),
+    file: List[Path] = typer.Option(
+        None, "--file", "-f", exists=True, dir_okay=False, readable=True, help="Entity YAML file (repeatable)"
+    ),
     description: Optional[str] = typer.Option(None, "--description", help="Service description"),
     env: Optional[str] = typer.Option(None, "--env", help="Environment tag"),
     team: Optional[str] = typer.Option(None, "--team", help="Owning team"),
@@ -113,48 +141,59 @@ def apply_service(
     tag: List[str] = typer.Option(None, "--tag", help="Extra tag key:value"),
     debug: bool = typer.Option(False, "--debug", help="Show request/response"),
 ) -> None:
-    client = get_client_from_ctx(ctx)
+    if file:
+        if service or description or env or team or tier or tag:
+            raise typer.BadParameter(
+                "--service/--description/--env/--team/--tier/--tag cannot be combined with --file"
+            )
+        payloads = _load_entity_files(file)
+        names = [str(p["metadata"].get("name") or f) for p, f in zip(payloads, file)]
+    elif service:
+        payloads = [
+            _build_entity_payload(
+                service=service,
+                description=description,
+                env=env,
+                team=team,
+                tier=tier,
+                tags=tag or [],
+            )
+        ]
+        names = [service]
+    else:
+        raise typer.BadParameter("--service or --file is required")
 
-    payload = _build_entity_payload(
-        service=service,
-        description=description,
-        env=env,
-        team=team,
-        tier=tier,
-        tags=tag or [],
-    )
+    client = get_client_from_ctx(ctx)
 
     if debug:
-        console.rule("software-catalog payload")
-        console.print(RichJSON.from_data(payload))
-
-    try:
-        with console.status("[dim]Aplicando servicio[/dim]"):
-            resp = client.post("/api/v2/catalog/entity", json=payload)
-    
-        if debug:
-            console.print(RichJSON.from_data(resp))
-        else:
-            console.print(
-                t(
-                    SUCCESS_MSG["es"].format(service=service),
-                    SUCCESS_MSG["en"].format(service=service),
-                )
-            )
-    
-    except Exception as exc:
+        for payload in payloads:
+            console.rule("software-catalog payload")
+            print_json(console, payload, compact=True)
+
+    # The catalog endpoint takes one entity per request; send them concurrently
+    # over the pooled session instead of one CLI invocation per file.
+    with status(console, "[dim]Aplicando servicio[/dim]"):
+        with ThreadPoolExecutor(max_workers=min(_APPLY_WORKERS, len(payloads))) as pool:
+            futures = [pool.submit(client.post, _ENTITY_PATH, json=p) for p in payloads]
+
+    # Every entity was sent: report each one, then fail if any of them did
+    failed = None
+    for name, fut in zip(names, futures):
+        exc = fut.exception()
+        if exc is None:
+            if debug:
+                print_json(console, fut.result(), compact=True)
+            else:
+                console.print(_SUCCESS_TPL.format(service=name))
+            continue
+        failed = failed or exc
+        console.print(_ERROR_TPL.format(service=name))
         if debug and isinstance(exc, ApiError):
             console.print(f"[red]HTTP {exc.status_code}[/red]")
-            console.print(RichJSON.from_data(exc.payload))
-        else:
-            console.print(
-                t(
-                    ERROR_MSG["es"].format(service=service),
-                    ERROR_MSG["en"].format(service=service),
-                )
-            )
-        raise typer.Exit(code=1) from exc
-    
+            print_json(console, exc.payload, compact=True)
+    if failed is not None:
+        raise typer.Exit(code=1) from failed
+
 
 @app.command(
     "get",
@@ -168,10 +207,10 @@ def get_service(
     client = get_client_from_ctx(ctx)
 
     try:
-        with console.status("[dim]Obteniendo servicio[/dim]"):
-            resp = client.get("/api/v2/catalog/entity", params={"filter[name]": service})
+        with status(console, "[dim]Obteniendo servicio[/dim]"):
+            resp = client.get(_ENTITY_PATH, params={"filter[name]": service})
         if debug:
-            console.print(RichJSON.from_data(resp))
+            print_json(console, resp, compact=True)
             return
 
         items = resp.get("data", [])
@@ -193,10 +232,10 @@ def list_services(
     client = get_client_from_ctx(ctx)
 
     try:
-        with console.status("[dim]Listando servicios[/dim]"):
-            resp = client.get("/api/v2/catalog/entity")
+        with status(console, "[dim]Listando servicios[/dim]"):
+            resp = client.get(_ENTITY_PATH)
         if debug:
-            console.print(RichJSON.from_data(resp))
+            print_json(console, resp, compact=True)
             return
 
         items = resp.get("data", [])
@@ -4,6 +4,14 @@ from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed configs keyed by (path, mtime_ns, size): an edited file is re-read
+_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
 
 def _default_config_path() -> Path:
     return Path(os.path.expanduser("~")) / ".config" / "ddctl" / "config.yaml"
@@ -11,15 +19,23 @@ def _default_config_path() -> Path:
 
 def load_config(path: Optional[str]) -> Dict[str, Any]:
     cfg_path = Path(path).expanduser() if path else _default_config_path()
-    if not cfg_path.exists():
+    try:
+        st = cfg_path.stat()
+    except FileNotFoundError:
         return {}
-    with cfg_path.open("r", encoding="utf-8") as f:
-        try:
-            data = yaml.safe_load(f) or {}
-        except yaml.YAMLError as exc:
-            raise RuntimeError(f"Error al parsear YAML de config: {exc}") from exc
+    key = (str(cfg_path), st.st_mtime_ns, st.st_size)
+    hit = _CACHE.get(key)
+    if hit is not None:
+        return hit
+    # One read of the whole (small) file; libyaml decodes the bytes itself
+    text = cfg_path.read_bytes()
+    try:
+        data = yaml.load(text, Loader=_SafeLoader) or {}
+    except yaml.YAMLError as exc:
+        raise RuntimeError(f"Error al parsear YAML de config: {exc}") from exc
     if not isinstance(data, dict):
         raise RuntimeError("El archivo de configuración debe contener un mapeo YAML.")
+    _CACHE[key] = data
     return data
 
 
@@ -43,11 +59,8 @@ def resolve_context(
         app_key = env_app_key
         if not site:
             # Allow site to come from config if not defined in env
-            cfg = load_config(config_path)
-            ctxs = (cfg.get("contexts") or {}) if isinstance(cfg, dict) else {}
-            ctx = {}
-            if context_name and isinstance(ctxs, dict):
-                ctx = ctxs.get(context_name) or {}
+            contexts = load_config(config_path).get("contexts")
+            ctx = contexts.get(context_name) if context_name and isinstance(contexts, dict) else None
             site = (ctx or {}).get("site") or ""
         if not site:
             raise RuntimeError(
@@ -55,10 +68,9 @@ def resolve_context(
             )
         return site, api_key, app_key
 
-    # If no env credentials, try YAML
-    cfg = load_config(config_path)
-    contexts = cfg.get("contexts") if isinstance(cfg, dict) else None
-    if not contexts or not isinstance(contexts, dict):
+    # If no env credentials, try YAML (load_config always returns a dict)
+    contexts = load_config(config_path).get("contexts")
+    if not isinstance(contexts, dict) or not contexts:
         raise RuntimeError(
             "No credentials in env and no contexts in YAML. "
             "Set DD_SITE/DD_API_KEY/DD_APP_KEY or create the configuration file."
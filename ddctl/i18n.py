@@ -1,13 +1,15 @@
 import os
+from functools import cache
 from typing import Literal
 
 Lang = Literal["en", "es"]
 
 
+@cache
 def get_lang() -> Lang:
     """
     Language selection for help texts. Controlled by env var DDOGCTL_LANG.
-    Defaults to 'es'.
+    Defaults to 'es'. Resolved once per process.
     """
     val = (os.environ.get("DDOGCTL_LANG") or "").lower()
     if val.startswith("en"):
@@ -17,9 +19,11 @@ def get_lang() -> Lang:
     return "es"
 
 
+_IS_ES = get_lang() == "es"
+
+
 def t(es: str, en: str) -> str:
     """
     Returns the string in the currently selected language.
     """
-    return es if get_lang() == "es" else en
-
+    return es if _IS_ES else en
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Dict, Optional
 
+from rich.console import Console
+from rich.highlighter import JSONHighlighter
 from rich.table import Table
+from rich.text import Text
 from rich import box
 
+from .utils_json import dumps as json_dumps
 
-def _format_meta_pair(key: str, value: Optional[str]) -> Optional[str]:
-    if value is None or str(value).strip() == "":
-        return None
-    k = f"[dim]{key}[/dim]"
-    v = f"[bold]{value}[/bold]"
-    return f"{k}={v}"
+
+_META_KEYS = ("service", "env", "cluster", "from", "to", "date")
+_SEP = "  [dim]•[/dim]  "
 
 
 def build_title(base: str, metadata: Dict[str, Optional[str]] | None = None) -> str:
@@ -21,16 +23,14 @@ def build_title(base: str, metadata: Dict[str, Optional[str]] | None = None) ->
     """
     if not metadata:
         return base
-    parts = []
-    for k in ["service", "env", "cluster", "from", "to", "date"]:
-        if k in metadata:
-            pair = _format_meta_pair(k, metadata.get(k))
-            if pair:
-                parts.append(pair)
+    parts = [
+        f"[dim]{k}[/dim]=[bold]{v}[/bold]"
+        for k in _META_KEYS
+        if (v := metadata.get(k)) is not None and str(v).strip()
+    ]
     if not parts:
         return base
-    sep = "  [dim]•[/dim]  "
-    return f"{base}{sep}" + sep.join(parts)
+    return base + _SEP + _SEP.join(parts)
 
 
 def new_table(base_title: str, metadata: Dict[str, Optional[str]] | None = None) -> Table:
@@ -48,3 +48,33 @@ def new_table(base_title: str, metadata: Dict[str, Optional[str]] | None = None)
     )
     return table
 
+
+def json_renderable(data: Any) -> Text:
+    """
+    Highlighted, 2-space indented JSON renderable, used by print_json on a terminal.
+    Same result as rich's JSON.from_data, but serialized via utils_json (orjson when available).
+    """
+    text = JSONHighlighter()(json_dumps(data, indent=True).decode("utf-8"))
+    text.no_wrap = True
+    text.overflow = None
+    return text
+
+
+def print_json(console: Console, data: Any, *, compact: bool = False) -> None:
+    """
+    Print JSON: highlighted on a terminal; plain JSON written straight to the console
+    file when piped (2-space indented, or one line with compact=True for --debug dumps),
+    skipping Rich highlighting nobody sees in `| jq` or log files.
+    """
+    if console.is_terminal:
+        console.print(json_renderable(data))
+    else:
+        console.file.write(json_dumps(data, indent=not compact).decode("utf-8") + "\n")
+
+
+def status(console: Console, message: str) -> AbstractContextManager:
+    """
+    console.status() spinner on a terminal; a no-op context when piped or in CI,
+    so scripted runs skip the Live renderer entirely.
+    """
+    return console.status(message) if console.is_terminal else nullcontext()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json as _stdlib_json
+from typing import Any, Union
+
+try:  # Optional C-accelerated parser (pip install "ddctl[speed]")
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes/str. Uses orjson when available, stdlib json otherwise.
+    Raises ValueError on invalid input in both cases.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return _stdlib_json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes (2-space indented when `indent`). Uses orjson when
+    available; falls back to stdlib json for inputs orjson rejects (e.g., non-str keys).
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 if indent else 0, default=str)
+        except TypeError:
+            pass
+    return _stdlib_json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=str).encode("utf-8")
@@ -4,9 +4,8 @@ import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from dateutil import parser as dateutil_parser
-
-_REL_RE = re.compile(r"^-(\d+)([smhd])$")
+_REL_RE = re.compile(r"^-(\d+)([smhd])$", re.ASCII)
+_UNIT = {"s": 1, "m": 60, "h": 3600, "d": 86400}
 
 
 def parse_time(expr: str, now: Optional[datetime] = None) -> datetime:
@@ -26,24 +25,22 @@ def parse_time(expr: str, now: Optional[datetime] = None) -> datetime:
         lower = "-" + lower.split("now-", 1)[1]
     m = _REL_RE.match(lower)
     if m:
-        amount = int(m.group(1))
-        unit = m.group(2)
-        if unit == "s":
-            delta = timedelta(seconds=amount)
-        elif unit == "m":
-            delta = timedelta(minutes=amount)
-        elif unit == "h":
-            delta = timedelta(hours=amount)
-        else:
-            delta = timedelta(days=amount)
-        return reference - delta
-    # ISO / absolute datetime
+        return reference - timedelta(seconds=_UNIT[m.group(2)] * int(m.group(1)))
+    # ISO / absolute datetime (dateutil is only imported for this path)
+    from dateutil import parser as dateutil_parser
+
     dt = dateutil_parser.parse(expr)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
+_ZERO = timedelta(0)
+
+
 def to_iso8601(dt: datetime) -> str:
+    # parse_time already returns UTC: skip the astimezone copy in that case
+    if dt.utcoffset() == _ZERO:
+        return dt.isoformat()
     return dt.astimezone(timezone.utc).isoformat()
 
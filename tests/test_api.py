@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+
+import requests
+
+from ddctl.api import ApiClient
+
+
+def test_session_carries_auth_headers() -> None:
+    client = ApiClient(site="datadoghq.com", api_key="api", app_key="app")
+    headers = client._session.headers
+    assert headers["DD-API-KEY"] == "api"
+    assert headers["DD-APPLICATION-KEY"] == "app"
+    assert headers["Accept"] == "application/json"
+    assert headers["Accept-Encoding"] == "gzip, deflate"
+    adapter = client._session.get_adapter("https://api.datadoghq.com")
+    assert adapter.max_retries.total == 5
+    client.close()
+
+
+def test_retries_skip_client_errors() -> None:
+    client = ApiClient(site="datadoghq.com", api_key=None, app_key=None)
+    retries = client._session.get_adapter("https://api.datadoghq.com").max_retries
+    assert retries.is_retry("GET", 429)
+    assert retries.is_retry("GET", 502)
+    assert retries.is_retry("POST", 429)
+    assert retries.is_retry("POST", 503, has_retry_after=True)
+    # A POST may have been processed before a gateway error: never replay it
+    for status in (500, 502, 503, 504):
+        assert not retries.is_retry("POST", status)
+    assert "POST" not in retries.allowed_methods
+    for status in (400, 401, 403):
+        assert not retries.is_retry("GET", status)
+    assert 0 <= retries.increment("GET", "/").increment("GET", "/").get_backoff_time() <= 1.0
+    client.close()
+
+
+def _response(body: bytes, content_type: str) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    resp.headers["Content-Type"] = content_type
+    return resp
+
+
+def test_request_decodes_by_content_type(monkeypatch) -> None:
+    client = ApiClient(site="datadoghq.com", api_key=None, app_key=None)
+    responses = iter(
+        [
+            _response(b'{"valid": true}', "application/json"),
+            _response(b'[1, 2]', "text/plain"),
+            _response(b"OK", "text/plain"),
+            _response(b"[WARN] degraded", "text/plain"),
+            _response(b"", "application/json"),
+        ]
+    )
+    monkeypatch.setattr(client._session, "request", lambda **kwargs: next(responses))
+    assert client.get("/api/v1/validate") == {"valid": True}
+    assert client.get("/x") == [1, 2]
+    assert client.get("/x") == "OK"
+    assert client.get("/x") == "[WARN] degraded"
+    assert client.get("/x") == ""
+    client.close()
+
+
+def test_post_sends_serialized_body(monkeypatch) -> None:
+    client = ApiClient(site="datadoghq.com", api_key=None, app_key=None)
+    sent = {}
+
+    def fake_request(**kwargs):
+        sent.update(kwargs)
+        return _response(b"{}", "application/json")
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    client.post("/api/v2/incidents", json={"data": {"title": "é"}})
+    assert json.loads(sent["data"]) == {"data": {"title": "é"}}
+    client.get("/api/v1/validate")
+    assert sent["data"] is None
+    client.close()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ddctl.cache import CacheMiss, cached_post
+
+
+class _FakeClient:
+    site = "datadoghq.com"
+
+    def __init__(self, api_key: str = "api", app_key: str = "app") -> None:
+        self.api_key = api_key
+        self.app_key = app_key
+        self.calls = 0
+
+    def post(self, path, json=None):
+        self.calls += 1
+        return {"n": self.calls}
+
+
+def test_enabled_reuses_fresh_entries(tmp_path) -> None:
+    client = _FakeClient()
+    assert cached_post(client, "/x", {"q": 1}, cache_dir=tmp_path) == {"n": 1}
+    assert cached_post(client, "/x", {"q": 1}, cache_dir=tmp_path) == {"n": 1}
+    assert cached_post(client, "/x", {"q": 2}, cache_dir=tmp_path) == {"n": 2}
+    assert client.calls == 2
+
+
+def test_enabled_refreshes_expired_entries(tmp_path) -> None:
+    client = _FakeClient()
+    cached_post(client, "/x", {"q": 1}, cache_dir=tmp_path)
+    for entry in tmp_path.iterdir():
+        os.utime(entry, (0, 0))
+    assert cached_post(client, "/x", {"q": 1}, ttl=60, cache_dir=tmp_path) == {"n": 2}
+
+
+def test_replay_and_disabled_modes(tmp_path) -> None:
+    client = _FakeClient()
+    cached_post(client, "/x", {"q": 1}, key="k", cache_dir=tmp_path)
+    for entry in tmp_path.iterdir():
+        os.utime(entry, (0, 0))
+    assert cached_post(client, "/x", {"other": True}, key="k", mode="replay", cache_dir=tmp_path) == {"n": 1}
+    with pytest.raises(CacheMiss):
+        cached_post(client, "/x", {"q": 2}, mode="replay", cache_dir=tmp_path)
+    assert cached_post(client, "/x", {"q": 1}, key="k", mode="disabled", cache_dir=tmp_path) == {"n": 2}
+    assert client.calls == 2
+
+
+def test_entries_are_scoped_per_credentials(tmp_path) -> None:
+    org_a = _FakeClient(api_key="key-a")
+    org_b = _FakeClient(api_key="key-b")
+    assert cached_post(org_a, "/x", {"q": 1}, cache_dir=tmp_path) == {"n": 1}
+    assert cached_post(org_b, "/x", {"q": 1}, cache_dir=tmp_path) == {"n": 1}
+    assert org_b.calls == 1
+    assert not any("key-a" in p.read_text() or "key-a" in p.name for p in tmp_path.iterdir())
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from ddctl.cli import _SUBCOMMANDS, _help_stub, _load_subcommand, app
+
+
+def test_root_help_stubs_match_sub_apps() -> None:
+    for name in _SUBCOMMANDS:
+        assert _help_stub(name).help == _load_subcommand(name).help, name
+
+
+def test_unknown_command_suggests_lazy_sub_apps() -> None:
+    result = CliRunner().invoke(app, ["servics"])
+
+    assert result.exit_code == 2
+    assert "'services'" in result.output and "'service'" in result.output
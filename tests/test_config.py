@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ddctl.config import load_config, resolve_context
+
+
+def _write(path, text: str, mtime_ns: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path) -> None:
+    cfg = tmp_path / "config.yaml"
+    _write(cfg, "contexts:\n  prd:\n    site: datadoghq.com\n", 1_000_000_000)
+    first = load_config(str(cfg))
+    assert load_config(str(cfg)) is first
+
+    _write(cfg, "contexts:\n  prd:\n    site: datadoghq.eu\n", 2_000_000_000)
+    assert load_config(str(cfg))["contexts"]["prd"]["site"] == "datadoghq.eu"
+
+
+def test_load_config_missing_file(tmp_path) -> None:
+    assert load_config(str(tmp_path / "nope.yaml")) == {}
+
+
+def test_resolve_context_site_from_yaml_with_env_keys(tmp_path, monkeypatch) -> None:
+    cfg = tmp_path / "config.yaml"
+    _write(cfg, "contexts:\n  dev:\n    site: us5.datadoghq.com\n", 1_000_000_000)
+    monkeypatch.delenv("DD_SITE", raising=False)
+    monkeypatch.setenv("DD_API_KEY", "api")
+    monkeypatch.delenv("DD_APP_KEY", raising=False)
+
+    assert resolve_context("dev", str(cfg)) == ("us5.datadoghq.com", "api", None)
+    with pytest.raises(RuntimeError):
+        resolve_context(None, str(cfg))
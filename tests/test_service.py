@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+from typer.testing import CliRunner
+
+from ddctl.cli import app
+from ddctl.commands import service
+
+
+class _FakeClient:
+    site = "datadoghq.com"
+    api_key = "api"
+    app_key = "app"
+
+    def __init__(self, error_count: int = 0) -> None:
+        self.error_count = error_count
+        self.posted = []
+
+    def post(self, path, json=None):
+        self.posted.append((path, json))
+        if path == service._LOGS_SEARCH_PATH:
+            return {"data": []}
+        attrs = json["data"]["attributes"]
+        if "group_by" in attrs:
+            return {"data": {"attributes": {"buckets": [
+                {"by": {"resource_name": "GET /a"}, "compute": {"c0": 7}},
+                {"by": {"resource_name": "POST /b"}, "compute": {"c0": 3}},
+            ]}}}
+        if len(attrs["compute"]) == 2:
+            return {"data": {"attributes": {"buckets": [{"compute": {"c0": 100, "c1": 0.2}}]}}}
+        return {"data": {"attributes": {"buckets": [{"compute": {"c0": self.error_count}}]}}}
+
+    def top_posted(self) -> bool:
+        return any("group_by" in body["data"]["attributes"] for _, body in self.posted if "data" in body)
+
+
+def _troubleshoot(monkeypatch, tmp_path, client, *args):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(service, "get_client_from_ctx", lambda ctx: client)
+    return CliRunner().invoke(
+        app, ["service", "troubleshoot", "--service", "web", *args], terminal_width=200
+    )
+
+
+def test_troubleshoot_skips_top_resources_without_errors(tmp_path, monkeypatch) -> None:
+    client = _FakeClient(error_count=0)
+
+    result = _troubleshoot(monkeypatch, tmp_path, client)
+
+    assert result.exit_code == 0, result.output
+    assert len(client.posted) == 3
+    assert not client.top_posted()
+
+
+def test_troubleshoot_summarizes_top_resources_on_errors(tmp_path, monkeypatch) -> None:
+    client = _FakeClient(error_count=10)
+
+    result = _troubleshoot(monkeypatch, tmp_path, client)
+
+    assert result.exit_code == 0, result.output
+    assert client.top_posted()
+    assert "GET /a (7), POST /b (3)" in result.output
+
+
+@pytest.mark.parametrize("flags", [["--no-cache"], ["--debug"]])
+def test_troubleshoot_bypasses_cache(tmp_path, monkeypatch, flags) -> None:
+    modes = []
+    real_cached_post = service.cached_post
+
+    def recording_cached_post(*args, mode="enabled", **kwargs):
+        modes.append(mode)
+        return real_cached_post(*args, mode=mode, **kwargs)
+
+    monkeypatch.setattr(service, "cached_post", recording_cached_post)
+    client = _FakeClient(error_count=10)
+
+    first = _troubleshoot(monkeypatch, tmp_path, client, *flags)
+    second = _troubleshoot(monkeypatch, tmp_path, client, *flags)
+
+    assert first.exit_code == 0 and second.exit_code == 0, first.output
+    assert set(modes) == {"disabled"}
+    assert len(client.posted) == 8
+    assert not (tmp_path / ".cache" / "ddctl").exists()
+
+
+def test_troubleshoot_replay_miss_is_reported_without_debug(tmp_path, monkeypatch) -> None:
+    client = _FakeClient()
+
+    result = _troubleshoot(monkeypatch, tmp_path, client, "--cache-mode", "replay")
+
+    assert result.exit_code == 1
+    assert "No cached response" in result.output
+    assert client.posted == []
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from typer.testing import CliRunner
+
+from ddctl.api import ApiError
+from ddctl.cli import app
+from ddctl.commands import services
+
+
+class _FakeClient:
+    def __init__(self, failing=()) -> None:
+        self.posted = []
+        self.failing = set(failing)
+        self._lock = threading.Lock()
+
+    def post(self, path, json=None):
+        with self._lock:
+            self.posted.append((path, json))
+        if json["metadata"]["name"] in self.failing:
+            raise ApiError(400, {"errors": ["bad entity"]})
+        return {"data": {}}
+
+
+def _entity_files(tmp_path, *names):
+    files = []
+    for name in names:
+        f = tmp_path / f"{name}.yaml"
+        f.write_text(f"apiVersion: v3\nkind: service\nmetadata:\n  name: {name}\n", encoding="utf-8")
+        files += ["-f", str(f)]
+    return files
+
+
+def test_apply_posts_one_entity_per_file(tmp_path, monkeypatch) -> None:
+    client = _FakeClient()
+    monkeypatch.setattr(services, "get_client_from_ctx", lambda ctx: client)
+    files = _entity_files(tmp_path, "a", "b")
+
+    result = CliRunner().invoke(app, ["services", "apply", *files])
+
+    assert result.exit_code == 0, result.output
+    assert sorted(body["metadata"]["name"] for _, body in client.posted) == ["a", "b"]
+    assert {path for path, _ in client.posted} == {"/api/v2/catalog/entity"}
+
+
+def test_apply_requires_service_or_file(monkeypatch) -> None:
+    monkeypatch.setattr(services, "get_client_from_ctx", lambda ctx: _FakeClient())
+
+    result = CliRunner().invoke(app, ["services", "apply"])
+
+    assert result.exit_code != 0
+
+
+def test_apply_reports_every_entity_when_one_fails(tmp_path, monkeypatch) -> None:
+    client = _FakeClient(failing={"a"})
+    monkeypatch.setattr(services, "get_client_from_ctx", lambda ctx: client)
+
+    result = CliRunner().invoke(app, ["services", "apply", *_entity_files(tmp_path, "a", "b")])
+
+    assert result.exit_code == 1
+    assert len(client.posted) == 2
+    assert '"a"' in result.output and '"b"' in result.output
+
+
+def test_apply_debug_names_the_failing_entity(tmp_path, monkeypatch) -> None:
+    client = _FakeClient(failing={"a"})
+    monkeypatch.setattr(services, "get_client_from_ctx", lambda ctx: client)
+
+    result = CliRunner().invoke(app, ["services", "apply", "--debug", *_entity_files(tmp_path, "a", "b")])
+
+    assert result.exit_code == 1
+    assert services._ERROR_TPL.format(service="a") in result.output
+    assert "HTTP 400" in result.output
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["metadata: [unclosed\n", "- just\n- a list\n", "metadata: not-a-mapping\n"],
+)
+def test_apply_rejects_invalid_entity_files(tmp_path, monkeypatch, content) -> None:
+    client = _FakeClient()
+    monkeypatch.setattr(services, "get_client_from_ctx", lambda ctx: client)
+    f = tmp_path / "bad.yaml"
+    f.write_text(content, encoding="utf-8")
+
+    result = CliRunner().invoke(app, ["services", "apply", "-f", str(f)])
+
+    assert result.exit_code == 2
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert client.posted == []
+
+
+def test_apply_rejects_missing_file_and_mixed_flags(tmp_path, monkeypatch) -> None:
+    client = _FakeClient()
+    monkeypatch.setattr(services, "get_client_from_ctx", lambda ctx: client)
+
+    missing = CliRunner().invoke(app, ["services", "apply", "-f", str(tmp_path / "nope.yaml")])
+    mixed = CliRunner().invoke(app, ["services", "apply", *_entity_files(tmp_path, "a"), "--env", "prd"])
+
+    assert missing.exit_code == 2
+    assert mixed.exit_code == 2
+    assert client.posted == []
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import io
+import json
+
+from rich.console import Console
+
+from ddctl.ui import print_json
+
+
+def test_print_json_writes_plain_json_when_piped() -> None:
+    out = io.StringIO()
+    console = Console(file=out, force_terminal=False)
+
+    print_json(console, {"a": [1]})
+    pretty = out.getvalue()
+    print_json(console, {"a": [1]}, compact=True)
+    compact = out.getvalue()[len(pretty):]
+
+    assert pretty.startswith('{\n  "a": [\n')
+    assert json.loads(pretty) == {"a": [1]}
+    assert compact.count("\n") == 1
+    assert json.loads(compact) == {"a": [1]}
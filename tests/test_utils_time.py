@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ddctl.utils_time import parse_time, to_iso8601
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("expr", "delta"),
+    [
+        ("now", timedelta(0)),
+        ("now-15m", timedelta(minutes=15)),
+        ("-30s", timedelta(seconds=30)),
+        ("-1h", timedelta(hours=1)),
+        ("NOW-2d", timedelta(days=2)),
+    ],
+)
+def test_relative_expressions(expr, delta) -> None:
+    assert parse_time(expr, NOW) == NOW - delta
+
+
+def test_absolute_datetimes_are_utc() -> None:
+    assert parse_time("2024-01-01T03:00:00+02:00", NOW) == datetime(2024, 1, 1, 1, tzinfo=timezone.utc)
+    assert parse_time("2024-01-01T00:00:00", NOW) == NOW
+
+
+def test_to_iso8601_normalizes_to_utc() -> None:
+    assert to_iso8601(NOW) == "2024-01-01T00:00:00+00:00"
+    plus_two = timezone(timedelta(hours=2))
+    assert to_iso8601(datetime(2024, 1, 1, 2, tzinfo=plus_two)) == "2024-01-01T00:00:00+00:00"